@@ -173,6 +173,10 @@ class GraphPruningExplainer(BaseExplainer):
             desc=desc,
             unit='step')
 
+        # keep the retained explanation on device, copy it to host once after training
+        explanation_logits = None
+        explanation_node_importance = None
+
         for _ in pbar:
             logits, masked_feats = explainer()
             loss = explainer.loss(logits)
@@ -182,23 +186,26 @@ class GraphPruningExplainer(BaseExplainer):
             node_importance[node_importance < self.node_thresh] = 0.
             masked_feats = masked_feats * \
                 torch.stack(masked_feats.shape[-1] * [node_importance], dim=1).unsqueeze(dim=0).to(torch.float)
-            probs = torch.nn.Softmax()(logits.cpu().squeeze()).detach().numpy()
             pred_label = torch.argmax(logits, dim=0).squeeze()
 
             # handle early stopping if the labels is changed
             if pred_label.item() == init_pred_label:
                 self.node_feats_explanation = masked_feats
-                self.probs_explanation = probs
-                self.node_importance = torch_to_numpy(node_importance)
+                explanation_logits = logits.detach()
+                explanation_node_importance = node_importance.detach()
             else:
                 print('Predicted label changed. Early stopping.')
                 break
 
             explainer.zero_grad()
-            explainer.optimizer.zero_grad()
             loss.backward(retain_graph=True)
             explainer.optimizer.step()
 
+        if explanation_logits is not None:
+            self.probs_explanation = torch.nn.Softmax()(
+                explanation_logits.cpu().squeeze()).numpy()
+            self.node_importance = torch_to_numpy(explanation_node_importance)
+
         node_importance = self.node_importance
         logits = init_logits.cpu().detach().numpy()
 
@@ -137,6 +137,31 @@ class PipelineStep(ABC):
         else:
             return self._process(*args, **kwargs)
 
+    def _get_output_path(self, output_name: str) -> Optional[Path]:
+        """Path of the saved output of a datapoint
+
+        Args:
+            output_name (str): Unique identifier of the datapoint
+
+        Returns:
+            Optional[Path]: Path of the saved output. None if the step does not reuse saved outputs
+        """
+        return self.output_dir / f"{output_name}.h5"
+
+    def has_saved_output(self, output_name: Optional[str]) -> bool:
+        """Whether process will reuse a previously saved output instead of recomputing it
+
+        Args:
+            output_name (Optional[str]): Unique identifier of the datapoint
+
+        Returns:
+            bool: True if the saved output of output_name exists
+        """
+        if output_name is None or self.save_path is None:
+            return False
+        output_path = self._get_output_path(output_name)
+        return output_path is not None and output_path.exists()
+
     @abstractmethod
     def _process(self, *args: Any, **kwargs: Any) -> Any:
         """Abstract method that performs the computation of the pipeline step
@@ -203,7 +228,7 @@ class PipelineStep(ABC):
         assert (
             self.save_path is not None
         ), "Can only save intermediate output if base_path was not None when constructing the object"
-        output_path = self.output_dir / f"{output_name}.h5"
+        output_path = self._get_output_path(output_name)
         if output_path.exists():
             logging.info(
                 f"{self.__class__.__name__}: Output of {output_name} already exists, using it instead of recomputing"
@@ -319,10 +344,30 @@ class PipelineRunner:
         for input_name in self.inputs:
             assert input_name in inputs, f"{input_name} not found in keyword arguments"
 
+        # Select steps to run, starting from the outputs. A step that reuses its saved
+        # output does not need its inputs, so upstream steps only feeding it are skipped.
+        # Steps that would save an output are always run.
+        required = set(self.outputs)
+        steps = list()
+        for stage, config in reversed(list(zip(self.stages, self.stage_configs))):
+            reuses_output = stage.has_saved_output(output_name)
+            saves_output = (
+                output_name is not None
+                and stage.save_path is not None
+                and not reuses_output
+            )
+            if saves_output or not required.isdisjoint(config.get("outputs", [])):
+                steps.append((stage, config, reuses_output))
+                if not reuses_output:
+                    required.update(config["inputs"])
+
         # Compute pipelines steps
         variables = deepcopy(inputs)
-        for stage, config in zip(self.stages, self.stage_configs):
-            step_input = [variables[k] for k in config["inputs"]]
+        for stage, config, reuses_output in reversed(steps):
+            if reuses_output:
+                step_input = [variables.get(k) for k in config["inputs"]]
+            else:
+                step_input = [variables[k] for k in config["inputs"]]
             step_output = stage.process(*step_input, output_name=output_name)
             if not isinstance(step_output, tuple):
                 step_output = tuple([step_output])
@@ -24,6 +24,7 @@ from torchvision import transforms
 from tqdm.auto import tqdm
 
 from ..pipeline import PipelineStep
+from ..utils.torch import cudnn_benchmark
 
 
 class FeatureExtractor(PipelineStep):
@@ -474,8 +475,9 @@ class PatchFeatureExtractor:
         Returns:
             torch.Tensor: Embedding of image.
         """
-        patch = patch.to(self.device)
-        with torch.no_grad():
+        patch = patch.to(self.device, non_blocking=True)
+        # patches have a fixed size: let cudnn select the fastest kernels
+        with torch.no_grad(), cudnn_benchmark(self.device.type == "cuda"):
             embeddings = self.model(patch).squeeze()
         return embeddings
 
@@ -812,7 +814,8 @@ class DeepFeatureExtractor(FeatureExtractor):
             shuffle=False,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
-            collate_fn=self._collate_patches
+            collate_fn=self._collate_patches,
+            pin_memory=self.device.type == "cuda",
         )
         features = torch.empty(
             size=(
@@ -1086,7 +1089,8 @@ class GridDeepFeatureExtractor(FeatureExtractor):
             shuffle=False,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
-            collate_fn=self._collate_patches
+            collate_fn=self._collate_patches,
+            pin_memory=self.device.type == "cuda",
         )
         features = torch.empty(
             size=(
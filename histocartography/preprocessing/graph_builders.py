@@ -106,6 +106,17 @@ class BaseGraphBuilder(PipelineStep):
         self._build_topology(instance_map, centroids, graph)
         return graph
 
+    def _get_output_path(self, output_name: str) -> Path:
+        """Path of the saved graph of a datapoint
+
+        Args:
+            output_name (str): Name of output file
+
+        Returns:
+            Path: Path of the saved graph
+        """
+        return self.output_dir / f"{output_name}.bin"
+
     def _process_and_save(  # type: ignore[override]
         self,
         instance_map: np.ndarray,
@@ -127,7 +138,7 @@ class BaseGraphBuilder(PipelineStep):
         assert (
             self.save_path is not None
         ), "Can only save intermediate output if base_path was not None during construction"
-        output_path = self.output_dir / f"{output_name}.bin"
+        output_path = self._get_output_path(output_name)
         if output_path.exists():
             logging.info(
                 f"Output of {output_name} already exists, using it instead of recomputing"
@@ -19,6 +19,10 @@ class FileLoader(PipelineStep):
         ), "Can only create directory if base_path was not None when constructing the object"
         return Path(self.save_path)
 
+    def _get_output_path(self, output_name: str) -> None:
+        """Outputs are never saved, hence never reused"""
+        return None
+
     def _process_and_save(self, *args, output_name, **kwargs: Any) -> Any:
         return self._process(*args, **kwargs)
 
@@ -27,6 +27,7 @@ from tqdm import tqdm
 from ..pipeline import PipelineStep
 from ..utils.image import extract_patches_from_image
 from ..utils import download_box_link
+from ..utils.torch import cudnn_benchmark
 
 DATASET_TO_BOX_URL = {
     "pannuke": "https://ibm.box.com/shared/static/hrt04i3dcv1ph1veoz8x6g8a72u0uw58.pt",
@@ -124,25 +125,29 @@ class NucleiExtractor(PipelineStep):
             image_dataset,
             shuffle=False,
             batch_size=self.batch_size,
-            collate_fn=collate)
+            collate_fn=collate,
+            pin_memory=self.device.type == "cuda",
+        )
         pred_map = torch.empty(
             size=(image_dataset.max_x_coord, image_dataset.max_y_coord, 3),
             dtype=torch.float32,
             device=self.device,
         )
 
-        for coords, image_batch in tqdm(
-            image_loader, desc="Patch-level nuclei detection"
-        ):
-            image_batch = image_batch.to(self.device)
-            with torch.no_grad():
-                out = self.model(image_batch).cpu()
-                for i in range(out.shape[0]):
-                    left = coords[i][0]  # left, bottom, right, top
-                    bottom = coords[i][1]
-                    right = coords[i][2]
-                    top = coords[i][3]
-                    pred_map[bottom:top, left:right, :] = out[i, :, :, :]
+        # patches have a fixed size: let cudnn select the fastest kernels
+        with cudnn_benchmark(self.device.type == "cuda"):
+            for coords, image_batch in tqdm(
+                image_loader, desc="Patch-level nuclei detection"
+            ):
+                image_batch = image_batch.to(self.device, non_blocking=True)
+                with torch.no_grad():
+                    out = self.model(image_batch)
+                    for i in range(out.shape[0]):
+                        left = coords[i][0]  # left, bottom, right, top
+                        bottom = coords[i][1]
+                        right = coords[i][2]
+                        top = coords[i][3]
+                        pred_map[bottom:top, left:right, :] = out[i, :, :, :]
 
         # crop to original image size
         pred_map = pred_map.cpu().detach().numpy()
@@ -88,6 +88,10 @@ class StatsComputer(PipelineStep):
         else:
             self._file_path = None
 
+    def _get_output_path(self, output_name: str) -> None:
+        """Values are appended to a shared file and always recomputed"""
+        return None
+
     def _process_and_save(
         self, *args: Any, output_name: str, **kwargs: Any
     ) -> Any:
@@ -373,7 +373,7 @@ class MergedSuperpixelExtractor(SuperpixelExtractor):
         assert (
             self.save_path is not None
         ), "Can only save intermediate output if base_path was not None when constructing the object"
-        superpixel_output_path = self.output_dir / f"{output_name}.h5"
+        superpixel_output_path = self._get_output_path(output_name)
         if superpixel_output_path.exists():
             logging.info(
                 f"{self.__class__.__name__}: Output of {output_name} already exists, using it instead of recomputing"
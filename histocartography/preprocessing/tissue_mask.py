@@ -1,6 +1,7 @@
 from ..pipeline import PipelineStep
 import logging
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Tuple, Union
 
@@ -8,11 +9,29 @@ import cv2
 import numpy as np
 from PIL import Image
 from scipy import ndimage
-from skimage.filters import gaussian, threshold_otsu
+from skimage.filters import threshold_otsu
 
 Image.MAX_IMAGE_PIXELS = 100000000000
 
 
+@lru_cache(maxsize=8)
+def _gaussian_kernel(sigma: float) -> np.ndarray:
+    """Get a 1D gaussian kernel truncated at 4 sigma, same as skimage.filters.gaussian.
+       Cached, as get_tissue_mask is called once per tissue region with the same sigma.
+
+    Args:
+        sigma (float): Sigma of gaussian filter.
+
+    Returns:
+        np.ndarray: (kernel_size, 1) read-only float64 kernel summing to 1.
+    """
+    kernel_size = 2 * int(4.0 * sigma + 0.5) + 1
+    kernel = cv2.getGaussianKernel(kernel_size, sigma)
+    # shared by all callers: fail loudly on modification
+    kernel.setflags(write=False)
+    return kernel
+
+
 def get_tissue_mask(
     image: np.ndarray,
     n_thresholding_steps: int = 1,
@@ -48,23 +67,49 @@ def get_tissue_mask(
 
     for _ in range(n_thresholding_steps):
 
-        # gaussian smoothing of grayscale thumbnail
+        # gaussian smoothing of grayscale thumbnail (same separable filter as
+        # skimage.filters.gaussian, hence same cost for float64 thumbnails).
+        # With a single step, 8-bit thumbnails stay 8-bit: the kernel sums to 1,
+        # so the rounded result fits and the intermediate is 8x smaller than
+        # float64. The Otsu threshold below is then quantized to an integer
+        # gray level and the whole threshold bin is kept, i.e., the cut moves
+        # by up to about one gray level and a few percent of the thresholded
+        # region can differ from the float64 path.
+        # Repeated steps keep float64, as rounding would zero out small tails.
         if sigma > 0.0:
-            thumbnail = gaussian(
+            kernel = _gaussian_kernel(sigma)
+            if thumbnail.dtype != np.uint8 or n_thresholding_steps > 1:
+                thumbnail = thumbnail.astype(np.float64)
+            thumbnail = cv2.sepFilter2D(
                 thumbnail,
-                sigma=sigma,
-                output=None,
-                mode="nearest",
-                preserve_range=True)
+                -1,
+                kernel,
+                kernel,
+                borderType=cv2.BORDER_REPLICATE,
+            )
+
+        if thumbnail.dtype == np.uint8:
+            # get threshold to keep analysis region (OpenCV Otsu on the 8-bit histogram)
+            foreground = thumbnail[thumbnail > 0]
+            if foreground.size > 0:
+                thresh, _ = cv2.threshold(
+                    foreground, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            else:  # all values are zero
+                thresh = 0
 
-        # get threshold to keep analysis region
-        try:
-            thresh = threshold_otsu(thumbnail[thumbnail > 0])
-        except ValueError:  # all values are zero
-            thresh = 0
+            # replace pixels outside analysis region (< thresh) in a single pass
+            _, thumbnail = cv2.threshold(
+                thumbnail, thresh - 1, 0, cv2.THRESH_TOZERO)
 
-        # replace pixels outside analysis region with upper quantile pixels
-        thumbnail[thumbnail < thresh] = 0
+        else:
+            # get threshold to keep analysis region
+            try:
+                thresh = threshold_otsu(thumbnail[thumbnail > 0])
+            except ValueError:  # all values are zero
+                thresh = 0
+
+            # replace pixels outside analysis region with upper quantile pixels
+            thumbnail[thumbnail < thresh] = 0
 
     # convert to binary
     mask = 0 + (thumbnail > 0)
@@ -86,12 +131,24 @@ def get_tissue_mask(
 
 
 class TissueMask(PipelineStep):
+    def _get_output_path(self, output_name: str) -> Path:
+        """Path of the saved tissue mask png of a datapoint
+
+        Args:
+            output_name (str): Name of output file
+
+        Returns:
+            Path: Path of the saved tissue mask png
+        """
+        return self.output_dir / f"{output_name}.png"
+
     def _process_and_save(
             self,
             *args,
             output_name: str,
             **kwargs) -> np.ndarray:
-        """Process and save in the provided path as a png image
+        """Process and save in the provided path as a 1-bit png image. Tissue masks
+           only contain 0 (background) and 1 (tissue).
 
         Args:
             output_name (str): Name of output file
@@ -99,7 +156,7 @@ class TissueMask(PipelineStep):
         assert (
             self.save_path is not None
         ), "Can only save intermediate output if base_path was not None during construction"
-        output_path = self.output_dir / f"{output_name}.png"
+        output_path = self._get_output_path(output_name)
         if output_path.exists():
             logging.info(
                 "%s: Output of %s already exists, using it instead of recomputing",
@@ -109,14 +166,17 @@ class TissueMask(PipelineStep):
             try:
                 with Image.open(output_path) as input_file:
                     output = np.array(input_file)
+                    if input_file.mode == "1":
+                        output = output.astype(np.uint8)
             except OSError as error:
                 logging.critical("Could not open %s", output_path)
                 raise error
         else:
             output = self._process(*args, **kwargs)
-            # with Image.fromarray(np.uint8(output*255)) as output_image:
-            with Image.fromarray(output) as output_image:
-                output_image.save(output_path)
+            # tissue masks are binary (0/1), hence stored as 1 bit per pixel
+            with Image.fromarray(output.astype(bool)) as output_image:
+                # binary masks compress well even at the fastest zlib level
+                output_image.save(output_path, compress_level=1)
         return output
 
     def precompute(
@@ -206,9 +266,11 @@ class GaussianTissueMask(TissueMask):
 
     # type: ignore[override]
     def _process(self, image: np.ndarray) -> np.ndarray:
-        """Return the superpixels of a given input image
+        """Return the superpixels of a given input image. Grayscale images are used as is
+           (e.g., luma), whereas get_tissue_mask converts RGB images with COLOR_BGR2GRAY, i.e.,
+           with swapped red and blue weights. Masks of both inputs can thus slightly differ.
         Args:
-            image (np.array): Input image
+            image (np.array): Input RGB image, or grayscale image of shape (H, W)
         Returns:
             np.array: Extracted tissue mask
         """
@@ -218,29 +280,36 @@ class GaussianTissueMask(TissueMask):
             image = self._downsample(image, self.downsampling_factor)
 
         tissue_mask = np.zeros(shape=(image.shape[0], image.shape[1]))
-        image_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        is_grayscale = image.ndim == 2
+        if is_grayscale:
+            image_gray = image.copy()
+            background = 255
+        else:
+            image_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+            background = (255, 255, 255)
 
         # Detect tissue region
         while True:
             _, mask_ = get_tissue_mask(
-                image,
+                255 - image if is_grayscale else image,
                 n_thresholding_steps=self.n_thresholding_steps,
                 sigma=self.sigma,
                 min_size=self.min_size,
             )
             if mask_ is None:
                 break
-            mask_ = cv2.dilate(
-                mask_.astype(
-                    np.uint8),
-                self.kernel,
-                iterations=self.dilation_steps)
+            mask_ = mask_.astype(np.uint8)
+            # a 1x1 kernel (or no step) leaves the mask unchanged, whereas
+            # cv2.dilate treats an empty kernel (kernel_size=0) as 3x3
+            if self.kernel_size != 1 and self.dilation_steps > 0:
+                mask_ = cv2.dilate(
+                    mask_, self.kernel, iterations=self.dilation_steps)
             image_masked = mask_ * image_gray
 
             if image_masked[image_masked > 0].mean(
             ) < self.background_gray_value:
                 tissue_mask[mask_ != 0] = 1
-                image[mask_ != 0] = (255, 255, 255)
+                image[mask_ != 0] = background
             else:
                 break
         tissue_mask = tissue_mask.astype(np.uint8)
@@ -262,6 +331,10 @@ class AnnotationPostProcessor(PipelineStep):
         ), "Can only create directory if base_path was not None when constructing the object"
         return Path(self.save_path)
 
+    def _get_output_path(self, output_name: str) -> None:
+        """Outputs are never saved, hence never reused"""
+        return None
+
     def _process(  # type: ignore[override]
         self, annotation: np.ndarray, tissue_mask: np.ndarray
     ) -> np.ndarray:
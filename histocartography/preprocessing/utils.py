@@ -7,19 +7,22 @@ from PIL import Image
 
 
 def fast_histogram(input_array: np.ndarray, nr_values: int) -> np.ndarray:
-    """Calculates a histogram of a matrix of the values from 0 up to (excluding) nr_values
+    """Calculates a histogram of a matrix of the values from 0 up to (excluding) nr_values.
+       Values outside of this range, as well as non-integral values, are ignored.
 
     Args:
-        x (np.array): Input tensor
+        input_array (np.array): Input tensor
         nr_values (int): Possible values. From 0 up to (exclusing) nr_values.
 
     Returns:
         np.array: Output tensor
     """
-    output_array = np.empty(nr_values, dtype=int)
-    for i in range(nr_values):
-        output_array[i] = (input_array == i).sum()
-    return output_array
+    values = np.ravel(input_array)
+    values = values[(values >= 0) & (values < nr_values)]
+    if not np.issubdtype(values.dtype, np.integer):
+        values = values[values == np.floor(values)]
+    # np.bincount only counts non-negative integers (safely castable to intp)
+    return np.bincount(values.astype(np.intp, copy=False), minlength=nr_values)
 
 
 def load_image(image_path: Path) -> np.ndarray:
@@ -35,6 +38,9 @@ def load_image(image_path: Path) -> np.ndarray:
     try:
         with Image.open(image_path) as img:
             image = np.array(img)
+            # 1-bit images (e.g., saved tissue masks) are loaded as 0/1 uint8
+            if img.mode == "1":
+                image = image.astype(np.uint8)
     except OSError as e:
         logging.critical("Could not open %s", image_path)
         raise OSError(e)
@@ -1,5 +1,24 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 import torch
 
 
 def torch_to_numpy(x):
     return x.cpu().detach().numpy()
+
+
+@contextmanager
+def cudnn_benchmark(enabled: bool = True) -> Iterator[None]:
+    """Sets torch.backends.cudnn.benchmark within the context and restores the previous
+       value on exit. Benchmarking pays off when the input size is fixed, e.g., for patches.
+
+    Args:
+        enabled (bool, optional): Whether to let cudnn benchmark and select the fastest kernels. Defaults to True.
+    """
+    previous = torch.backends.cudnn.benchmark
+    torch.backends.cudnn.benchmark = enabled
+    try:
+        yield
+    finally:
+        torch.backends.cudnn.benchmark = previous
@@ -8,7 +8,7 @@ import dgl
 import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 import matplotlib
-from skimage.segmentation import mark_boundaries
+from skimage.segmentation import find_boundaries
 
 from ..ml.layers.constants import CENTROID
 from ..pipeline import PipelineStep
@@ -126,13 +126,14 @@ class InstanceImageVisualization(BaseImageVisualization):
         color = instance_attributes.get(COLOR, self.color)
         colormap = instance_attributes.get(COLORMAP, self.colormap)
 
+        # copy, as the canvas may be a PIL image (e.g., from HACT) or grayscale
+        canvas = np.array(canvas)
+        if canvas.ndim == 2:
+            canvas = np.stack([canvas] * 3, axis=-1)
+
         if "outline" in self.instance_style.lower():
-            canvas = np.uint8(
-                255
-                * mark_boundaries(
-                    canvas, instance_map, color=name2rgb(color), mode="thick"
-                )
-            )
+            boundaries = find_boundaries(instance_map, mode="thick")
+            canvas[boundaries] = np.uint8(255 * np.array(name2rgb(color)))
 
         if "fill" in self.instance_style.lower():
             canvas[instance_map > 0] = canvas[instance_map > 0] * \
@@ -304,8 +305,8 @@ class OverlayGraphVisualization(BaseGraphVisualization):
         Draws the nodes on top of the canvas.
         """
 
-        # extract centroids
-        centroids = graph.ndata[CENTROID]
+        # extract centroids (single device to host copy)
+        centroids = graph.ndata[CENTROID].cpu().tolist()
 
         if node_attributes is None:
             node_attributes = {}
@@ -363,10 +364,10 @@ class OverlayGraphVisualization(BaseGraphVisualization):
         """
         Draws the edges on top of the canvas.
         """
-        # extract centroids
-        centroids = graph.ndata[CENTROID]
+        # extract centroids and edges (single device to host copy each)
+        centroids = graph.ndata[CENTROID].cpu().tolist()
         src, dst = graph.edges()
-        edges = [(s.item(), d.item()) for (s, d) in zip(src, dst)]
+        edges = zip(src.cpu().tolist(), dst.cpu().tolist())
 
         if edge_attributes is None:
             edge_attributes = {}
@@ -387,12 +388,12 @@ class OverlayGraphVisualization(BaseGraphVisualization):
         if self.edge_style is not None:
             for edge in edges:
                 src_centroid = [
-                    centroids[edge[0]][1].item(),
-                    centroids[edge[0]][0].item(),
+                    centroids[edge[0]][1],
+                    centroids[edge[0]][0],
                 ]
                 dst_centroid = [
-                    centroids[edge[1]][1].item(),
-                    centroids[edge[1]][0].item(),
+                    centroids[edge[1]][1],
+                    centroids[edge[1]][0],
                 ]
                 draw_line(
                     src_centroid,
@@ -1,13 +1,16 @@
 """Unit test for preprocessing.tissue_mask"""
 import unittest
+import cv2
 import numpy as np
 import yaml
 import os
 from PIL import Image
 import shutil
+from copy import deepcopy
 
 from histocartography import PipelineRunner
 from histocartography.preprocessing import GaussianTissueMask
+from histocartography.preprocessing.tissue_mask import get_tissue_mask
 from histocartography.utils import download_test_data
 
 
@@ -25,6 +28,25 @@ class TissueMaskTestCase(unittest.TestCase):
         if os.path.exists(self.out_path) and os.path.isdir(self.out_path):
             shutil.rmtree(self.out_path)
         os.makedirs(self.out_path)
+        config_fname = os.path.join(
+            self.current_path,
+            'config',
+            'tissue_mask',
+            'tissue_mask.yml')
+        with open(config_fname, 'r') as file:
+            self.config = yaml.load(
+                file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        self.tissue_detecter = GaussianTissueMask(kernel_size=5)
+
+    def _assert_valid_tissue_mask(self, tissue_mask):
+        """
+        Assert that the tissue mask is binary with a plausible amount of tissue.
+        """
+        counts = np.bincount(tissue_mask.ravel(), minlength=2)
+        self.assertEqual(counts.size, 2)  # mask is binary
+        self.assertTrue(counts.all())  # with tissue and background
+        # tissue pixel count large enough, but not too large
+        self.assertTrue(1e6 < counts[1] < 2e6)
 
     def test_gaussian_tissue_mask_with_pipeline_runner(self):
         """
@@ -32,29 +54,16 @@ class TissueMaskTestCase(unittest.TestCase):
         """
 
         # 1. Tissue mask detection with saving
-        config_fname = os.path.join(
-            self.current_path,
-            'config',
-            'tissue_mask',
-            'tissue_mask.yml')
-        with open(config_fname, 'r') as file:
-            config = yaml.safe_load(file)
-        pipeline = PipelineRunner(output_path=self.out_path, **config)
+        pipeline = PipelineRunner(
+            output_path=self.out_path, **deepcopy(self.config))
         output = pipeline.run(
             output_name=self.image_name.replace('.jpg', ''),
             image_path=os.path.join(self.image_path, self.image_name)
         )
         tissue_mask = output['tissue_mask']
 
-        self.assertEqual(
-            list(
-                tissue_mask.shape), [
-                1024, 1280])  # image HxW = mask HxW
-        self.assertTrue(list(np.unique(tissue_mask))
-                        == [0, 1])  # mask is binary
-        # tissue pixel count large enough
-        self.assertTrue(np.sum(tissue_mask) > 1e6)
-        self.assertTrue(np.sum(tissue_mask) < 2e6)  # but not too large
+        self.assertEqual(tissue_mask.shape, (1024, 1280))  # image HxW = mask HxW
+        self._assert_valid_tissue_mask(tissue_mask)
 
         # 2. Re-run with existing output & ensure equal
         output = pipeline.run(
@@ -63,7 +72,8 @@ class TissueMaskTestCase(unittest.TestCase):
         )
         reload_tissue_mask = output['tissue_mask']
 
-        self.assertTrue(np.array_equal(tissue_mask, reload_tissue_mask))
+        self.assertEqual(tissue_mask.shape, reload_tissue_mask.shape)
+        self.assertFalse(np.bitwise_xor(tissue_mask, reload_tissue_mask).any())
 
     def test_gaussian_tissue_mask(self):
         """
@@ -71,27 +81,22 @@ class TissueMaskTestCase(unittest.TestCase):
         """
 
         # 1. load the image
-        image = np.array(
-            Image.open(
+        image = cv2.cvtColor(
+            cv2.imread(
                 os.path.join(
                     self.image_path,
-                    self.image_name)))
+                    self.image_name)),
+            cv2.COLOR_BGR2RGB)
 
         # 2. run tissue mask detection
-        tissue_detecter = GaussianTissueMask(kernel_size=5)
-        tissue_mask = tissue_detecter.process(image)
+        tissue_mask = self.tissue_detecter.process(image)
 
         # image HxW = mask HxW
-        self.assertEqual(list(image.shape), [1024, 1280, 3])
-        self.assertTrue(len(list(tissue_mask.shape))
-                        == 2)      # mask is bi-dim
+        self.assertEqual(image.shape, (1024, 1280, 3))
+        self.assertEqual(tissue_mask.ndim, 2)      # mask is bi-dim
         self.assertEqual(image.shape[:-1],
                          tissue_mask.shape)  # image HxW = mask HxW
-        self.assertTrue(list(np.unique(tissue_mask))
-                        == [0, 1])  # mask is binary
-        # tissue pixel count large enough
-        self.assertTrue(np.sum(tissue_mask) > 1e6)
-        self.assertTrue(np.sum(tissue_mask) < 2e6)  # but not too large
+        self._assert_valid_tissue_mask(tissue_mask)
 
         # 3. save tissue mask
         tissue_mask = Image.fromarray(np.uint8(tissue_mask * 255))
@@ -101,8 +106,49 @@ class TissueMaskTestCase(unittest.TestCase):
                 self.image_name.replace(
                     '.jpg',
                     '.png')),
+            compress_level=1,
         )
 
+    def test_gaussian_tissue_mask_grayscale(self):
+        """
+        Test gaussian tissue mask on an image decoded to grayscale.
+        """
+
+        # 1. load the image, decoding the JPEG straight to luma (unlike the
+        # BGR2GRAY conversion of RGB inputs in get_tissue_mask)
+        with Image.open(
+                os.path.join(self.image_path, self.image_name)) as image_file:
+            image_file.draft('L', image_file.size)
+            image = np.array(image_file.convert('L'))
+
+        # 2. run tissue mask detection
+        tissue_mask = self.tissue_detecter.process(image)
+
+        # image HxW = mask HxW
+        self.assertEqual(image.shape, (1024, 1280))
+        self.assertEqual(image.shape, tissue_mask.shape)
+        self._assert_valid_tissue_mask(tissue_mask)
+
+    def test_tissue_mask_uint8_smoothing(self):
+        """
+        Test that 8-bit smoothing stays close to the float64 path.
+        """
+
+        # 1. load the image as an inverted grayscale thumbnail
+        image = cv2.imread(os.path.join(self.image_path, self.image_name))
+        image = GaussianTissueMask._downsample(image, 4)
+        thumbnail = 255 - cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        # 2. detect tissue on the 8-bit and float64 thumbnails
+        _, mask = get_tissue_mask(thumbnail, sigma=20, min_size=10)
+        _, float_mask = get_tissue_mask(
+            thumbnail.astype(np.float64), sigma=20, min_size=10)
+
+        # 3. the quantized Otsu threshold changes at most 5% of the mask
+        self.assertEqual(mask.shape, float_mask.shape)
+        nr_changed = np.count_nonzero(mask != float_mask)
+        self.assertLessEqual(nr_changed, 0.05 * np.count_nonzero(float_mask))
+
     def tearDown(self):
         """Tear down the tests."""
 
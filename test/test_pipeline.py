@@ -0,0 +1,207 @@
+"""Unit test for pipeline"""
+import unittest
+import numpy as np
+import os
+import shutil
+from unittest import mock
+
+from histocartography import PipelineRunner
+from histocartography.pipeline import PipelineStep
+from histocartography.preprocessing.io import FileLoader
+from histocartography.utils import dynamic_import_from
+
+
+class DummyLoader(FileLoader):
+    """Loader counting how often it is run"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.nr_calls = 0
+
+    def process(self, *args, **kwargs):
+        self.nr_calls += 1
+        return super().process(*args, **kwargs)
+
+    def _process(self, value):  # type: ignore[override]
+        return np.asarray(value)
+
+
+class AddStep(PipelineStep):
+    """Step adding an offset to its input and counting how often it is run"""
+
+    def __init__(self, offset: int, **kwargs) -> None:
+        self.offset = offset
+        super().__init__(**kwargs)
+        self.nr_calls = 0
+
+    def process(self, *args, **kwargs):
+        self.nr_calls += 1
+        return super().process(*args, **kwargs)
+
+    def _process(self, value):  # type: ignore[override]
+        return value + self.offset
+
+
+class SumStep(AddStep):
+    """Step summing its two inputs"""
+
+    def _process(self, value, other):  # type: ignore[override]
+        return value + other + self.offset
+
+
+DUMMY_STEPS = {
+    step.__name__: step for step in [DummyLoader, AddStep, SumStep]
+}
+
+
+def import_step(source_file: str, class_name: str):
+    if class_name in DUMMY_STEPS:
+        return DUMMY_STEPS[class_name]
+    return dynamic_import_from(source_file, class_name)
+
+
+def stage(class_name: str, inputs, outputs, **params) -> dict:
+    return {
+        'preprocessing': {
+            'class': class_name,
+            'inputs': inputs,
+            'outputs': outputs,
+            'params': params,
+        }
+    }
+
+
+class PipelineTestCase(unittest.TestCase):
+    """PipelineTestCase class."""
+
+    @classmethod
+    def setUpClass(self):
+        self.current_path = os.path.dirname(__file__)
+        self.data_path = os.path.join(self.current_path, 'data')
+        self.out_path = os.path.join(self.data_path, 'pipeline_test')
+        if os.path.exists(self.out_path) and os.path.isdir(self.out_path):
+            shutil.rmtree(self.out_path)
+        os.makedirs(self.out_path)
+
+    def setUp(self):
+        patcher = mock.patch(
+            'histocartography.pipeline.dynamic_import_from', import_step)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _build_pipeline(self, name: str, **config) -> PipelineRunner:
+        output_path = os.path.join(self.out_path, name)
+        os.makedirs(output_path)
+        return PipelineRunner(output_path=output_path, **config)
+
+    def test_reuse_final_output(self):
+        """
+        Test that reusing the final output does not run the upstream loader.
+        """
+
+        pipeline = self._build_pipeline(
+            'final_output',
+            inputs=['value'],
+            outputs=['result'],
+            stages=[
+                stage('DummyLoader', ['value'], ['loaded']),
+                stage('AddStep', ['loaded'], ['result'], offset=1),
+            ],
+        )
+        loader, add_step = pipeline.stages
+
+        # 1. Run and save the final output
+        output = pipeline.run(output_name='sample', value=[1, 2])
+        self.assertEqual(output['result'].tolist(), [2, 3])
+        self.assertEqual(loader.nr_calls, 1)
+        self.assertEqual(add_step.nr_calls, 1)
+
+        # 2. Re-run with existing output & ensure the loader is skipped
+        output = pipeline.run(output_name='sample', value=[1, 2])
+        self.assertEqual(output['result'].tolist(), [2, 3])
+        self.assertEqual(loader.nr_calls, 1)
+        self.assertEqual(add_step.nr_calls, 2)
+
+    def test_reuse_intermediate_output(self):
+        """
+        Test that reusing an intermediate output only skips the steps feeding it alone.
+        """
+
+        pipeline = self._build_pipeline(
+            'intermediate_output',
+            inputs=['value'],
+            outputs=['result'],
+            save_intermediate=True,
+            stages=[
+                stage('DummyLoader', ['value'], ['loaded']),
+                stage('AddStep', ['loaded'], ['first'], offset=1),
+                stage('AddStep', ['first'], ['second'], offset=2),
+                stage('SumStep', ['loaded', 'second'], ['result'], offset=0),
+            ],
+        )
+        loader, first_step, second_step, sum_step = pipeline.stages
+
+        # 1. Run and save all outputs
+        output = pipeline.run(output_name='sample', value=[1, 2])
+        self.assertEqual(output['result'].tolist(), [5, 7])
+
+        # 2. Re-run without the final output
+        os.remove(sum_step._get_output_path('sample'))
+        output = pipeline.run(output_name='sample', value=[1, 2])
+        self.assertEqual(output['result'].tolist(), [5, 7])
+        self.assertEqual(loader.nr_calls, 2)  # still feeds the sum
+        self.assertEqual(first_step.nr_calls, 1)  # only feeds the reused step
+        self.assertEqual(second_step.nr_calls, 2)
+        self.assertEqual(sum_step.nr_calls, 2)
+
+    def test_steps_without_saved_outputs(self):
+        """
+        Test that steps without reusable outputs still run when saving.
+        """
+
+        pipeline = self._build_pipeline(
+            'unsaved_outputs',
+            inputs=['value', 'annotation'],
+            outputs=['tissue_mask'],
+            save_intermediate=True,
+            stages=[
+                stage('DummyLoader', ['value'], ['loaded']),
+                stage('AddStep', ['loaded'], ['tissue_mask'], offset=0),
+                stage(
+                    'AnnotationPostProcessor',
+                    ['annotation', 'tissue_mask'],
+                    ['processed_annotation'],
+                    background_index=0,
+                ),
+                stage(
+                    'SuperpixelCounter',
+                    ['processed_annotation'],
+                    ['counter'],
+                ),
+            ],
+        )
+        loader, mask_step, _, counter = pipeline.stages
+        inputs = {
+            'value': [[0, 1], [1, 1]],
+            'annotation': np.array([[1, 2], [3, 3]]),
+        }
+
+        # 1. Run twice, reusing the tissue mask the second time
+        for _ in range(2):
+            output = pipeline.run(output_name='sample', **inputs)
+            self.assertEqual(output['tissue_mask'].tolist(), [[0, 1], [1, 1]])
+        self.assertEqual(loader.nr_calls, 2)
+        self.assertEqual(mask_step.nr_calls, 2)
+
+        # 2. Ensure the counter was written on both runs
+        with open(counter._file_path, 'r') as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines, ['name,value', 'sample,3', 'sample,3'])
+
+    def tearDown(self):
+        """Tear down the tests."""
+
+
+if __name__ == "__main__":
+
+    unittest.main()
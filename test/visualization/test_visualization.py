@@ -184,6 +184,76 @@ class GraphVizTestCase(unittest.TestCase):
             ),
             quality=95)
 
+    def test_hact_viz_with_tissue_instance_map(self):
+        """Test hierarchical visualization with tissue instances."""
+
+        # 1. load the corresponding image
+        image = np.array(
+            Image.open(
+                os.path.join(
+                    self.image_path,
+                    self.image_name)))
+
+        # 2. load tissue graph
+        tissue_graph, _ = load_graphs(os.path.join(
+            self.tissue_graph_path, self.graph_name))
+        tissue_graph = tissue_graph[0]
+
+        # 3. load cell graph
+        cell_graph, _ = load_graphs(os.path.join(
+            self.cell_graph_path, self.graph_name))
+        cell_graph = cell_graph[0]
+
+        # 4. extract tissue instances
+        extractor = SLICSuperpixelExtractor(nr_superpixels=50)
+        tissue_instance_map = extractor.process(image)
+
+        # 5. run the visualization
+        visualizer = HACTVisualization()
+        out = visualizer.process(
+            image,
+            cell_graph=cell_graph,
+            tissue_graph=tissue_graph,
+            tissue_instance_map=tissue_instance_map,
+        )
+
+        self.assertTrue(isinstance(out, Image.Image))
+        self.assertEqual(out.size, (image.shape[1], image.shape[0]))
+
+        # 6. save output image
+        out.save(
+            os.path.join(
+                self.out_path,
+                self.image_name.replace(
+                    ".png",
+                    "") +
+                "_hierarchical_tissue_overlay.png",
+            ),
+            quality=95)
+
+    def test_superpixel_viz_grayscale(self):
+        """Test instance visualization on a grayscale canvas."""
+
+        # 1. load the corresponding image
+        image = np.array(
+            Image.open(
+                os.path.join(
+                    self.image_path,
+                    self.image_name)))
+
+        # 2. extract superpixels
+        extractor = SLICSuperpixelExtractor(nr_superpixels=50)
+        instance_map = extractor.process(image)
+
+        # 3. run the visualization on the grayscale image
+        gray_image = np.array(Image.fromarray(image).convert("L"))
+        visualizer = InstanceImageVisualization(
+            color="darkgreen", instance_style="fill+outline")
+        out = visualizer.process(gray_image, instance_map=instance_map)
+
+        self.assertEqual(out.mode, "RGB")
+        self.assertEqual(out.size, (image.shape[1], image.shape[0]))
+
     def tearDown(self):
         """Tear down the tests."""
 